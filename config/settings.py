@@ -14,6 +14,8 @@ DATA_DIR = PROJECT_ROOT / "data"
 RAW_DATA_DIR = DATA_DIR / "raw"
 LAKE_DATA_DIR = DATA_DIR / "lake"
 EXPORTS_DIR = DATA_DIR / "exports"
+# Written by the graph loader after each successful load; render caches key on it
+GRAPH_LOAD_STAMP = DATA_DIR / "graph_load_stamp"
 
 # Ensure data directories exist
 for d in [RAW_DATA_DIR, LAKE_DATA_DIR, EXPORTS_DIR]:
@@ -15,6 +15,7 @@ console = Console()
 
 # Schema definitions: column name -> pandas dtype
 # date columns listed separately for pd.to_datetime conversion
+# derived columns are stored space-joined copies of other columns
 SCHEMAS = {
     "hris": {
         "employees": {
@@ -35,6 +36,7 @@ SCHEMAS = {
                 "termination_reason": "string",
             },
             "dates": ["hire_date", "birth_date", "termination_date"],
+            "derived": {"full_name": ["first_name", "last_name"]},
         },
         "departments": {
             "dtypes": {
@@ -264,6 +266,11 @@ def build_lake() -> dict[str, int]:
                 if col in df.columns:
                     df[col] = pd.to_datetime(df[col], errors="coerce")
 
+            # Add derived columns (null if any part is null, like SQL ||)
+            for col, parts in schema.get("derived", {}).items():
+                if all(p in df.columns for p in parts):
+                    df[col] = df[parts[0]].str.cat([df[p] for p in parts[1:]], sep=" ")
+
             # Write Parquet
             parquet_path = system_out_dir / f"{table_name}.parquet"
             df.to_parquet(parquet_path, index=False, engine="pyarrow")
@@ -11,6 +11,17 @@ from phase3_ontology.schema import ALL_NODE_SCHEMAS
 
 console = Console()
 
+# Properties the AI interface filters on by value (beyond the ID constraints)
+LOOKUP_INDEXES = [
+    ("Employee", "status"),
+    ("Employee", "job_family"),
+    ("Employee", "department_id"),
+    ("Division", "name"),
+    ("Department", "name"),
+    ("Skill", "name"),
+    ("PerformanceReview", "rating"),
+]
+
 
 def generate_constraint_statements() -> list[str]:
     """Generate Cypher statements for uniqueness constraints and indexes."""
@@ -42,10 +53,6 @@ def generate_constraint_statements() -> list[str]:
         "CREATE INDEX idx_employee_dept_level IF NOT EXISTS "
         "FOR (n:Employee) ON (n.department_id, n.job_level)"
     )
-    statements.append(
-        "CREATE INDEX idx_employee_status IF NOT EXISTS "
-        "FOR (n:Employee) ON (n.status)"
-    )
     statements.append(
         "CREATE INDEX idx_employee_gender IF NOT EXISTS "
         "FOR (n:Employee) ON (n.gender)"
@@ -55,9 +62,19 @@ def generate_constraint_statements() -> list[str]:
         "FOR (n:Employee) ON (n.ethnicity)"
     )
 
+    statements.extend(generate_lookup_index_statements())
     return statements
 
 
+def generate_lookup_index_statements() -> list[str]:
+    """Generate idempotent index statements for the query-time lookup properties."""
+    return [
+        f"CREATE INDEX idx_{label.lower()}_{prop} IF NOT EXISTS "
+        f"FOR (n:{label}) ON (n.{prop})"
+        for label, prop in LOOKUP_INDEXES
+    ]
+
+
 def print_constraints() -> None:
     """Print all constraint and index statements."""
     statements = generate_constraint_statements()
@@ -53,6 +53,7 @@ NODE_MAPPINGS = [
             "employee_id": "employee_id",
             "first_name": "first_name",
             "last_name": "last_name",
+            "full_name": "full_name",
             "email": "email",
             "hire_date": "hire_date",
             "birth_date": "birth_date",
@@ -32,7 +32,7 @@ EMPLOYEE = NodeSchema(
     id_property="employee_id",
     required=["employee_id", "first_name", "last_name", "email", "hire_date",
               "gender", "ethnicity", "job_level", "job_family", "status"],
-    optional=["birth_date", "termination_date", "termination_reason"],
+    optional=["full_name", "birth_date", "termination_date", "termination_reason"],
     indexes=["employee_id", "email"],
 )
 
@@ -98,6 +98,23 @@ def span_of_control(conn: Neo4jConnection) -> list[dict]:
     return results
 
 
+def span_stats(conn: Neo4jConnection) -> dict:
+    """Summarize span of control (avg/min/max direct reports) in one aggregation.
+
+    The reduction runs inside Neo4j, so only a single row crosses the wire
+    instead of one row per manager.
+    """
+    results = conn.run("""
+        MATCH (manager:Employee)<-[:REPORTS_TO]-(report:Employee)
+        WITH manager, COUNT(report) AS direct_reports
+        RETURN coalesce(avg(direct_reports), 0) AS avg,
+               coalesce(min(direct_reports), 0) AS min,
+               coalesce(max(direct_reports), 0) AS max,
+               count(manager) AS manager_count
+    """)
+    return results[0] if results else {"avg": 0, "min": 0, "max": 0, "manager_count": 0}
+
+
 def print_centrality_report(conn: Neo4jConnection) -> None:
     """Print a full centrality analysis report."""
     console.print("\n[bold blue]Centrality Analysis[/bold blue]\n")
@@ -115,12 +132,10 @@ def print_centrality_report(conn: Neo4jConnection) -> None:
     console.print(table)
 
     # Span of control stats
-    soc = span_of_control(conn)
-    if soc:
-        spans = [r["direct_reports"] for r in soc]
-        avg_span = sum(spans) / len(spans) if spans else 0
+    stats = span_stats(conn)
+    if stats["manager_count"]:
         console.print(f"\n[bold]Span of Control:[/bold]")
-        console.print(f"  Avg: {avg_span:.1f} | Min: {min(spans)} | Max: {max(spans)} | Managers: {len(spans)}")
+        console.print(f"  Avg: {stats['avg']:.1f} | Min: {stats['min']} | Max: {stats['max']} | Managers: {stats['manager_count']}")
 
 
 if __name__ == "__main__":
@@ -18,68 +18,65 @@ def cascade_impact(conn: Neo4jConnection, employee_id: str) -> dict:
     """Analyze the full organizational impact if an employee departs.
 
     Traverses: direct reports, reviews given, interviews conducted,
-    salary/compensation relationships, and goals.
+    salary/compensation relationships, and goals. Each facet is a CALL
+    subquery off a single employee lookup, so the analysis is one round-trip.
     """
-    # Get employee info
-    emp_info = conn.run("""
+    rows = conn.run("""
         MATCH (e:Employee {employee_id: $eid})
-        RETURN e.first_name + ' ' + e.last_name AS name,
-               e.job_level AS level,
-               e.department_id AS dept
+        // Direct reports left without manager
+        CALL {
+            WITH e
+            MATCH (report:Employee)-[:REPORTS_TO]->(e)
+            RETURN collect({
+                id: report.employee_id,
+                name: report.first_name + ' ' + report.last_name,
+                level: report.job_level
+            }) AS direct_reports
+        }
+        // Indirect reports (2 levels deep)
+        CALL {
+            WITH e
+            MATCH (indirect:Employee)-[:REPORTS_TO*2]->(e)
+            RETURN COUNT(indirect) AS indirect_report_count
+        }
+        // Performance reviews this person gives (as reviewer)
+        CALL {
+            WITH e
+            MATCH (r:PerformanceReview)-[:REVIEWED_BY]->(e)
+            MATCH (emp:Employee)-[:REVIEWED_IN]->(r)
+            RETURN COUNT(DISTINCT emp) AS employees_reviewed
+        }
+        // Interviews conducted
+        CALL {
+            WITH e
+            MATCH (i:Interview)-[:INTERVIEWED_BY]->(e)
+            RETURN COUNT(i) AS interviews_conducted
+        }
+        // Skills this person has (knowledge loss)
+        CALL {
+            WITH e
+            MATCH (e)-[:HAS_SKILL]->(s:Skill)
+            RETURN collect(s.name) AS skills_lost
+        }
+        // Goals that would be orphaned
+        CALL {
+            WITH e
+            MATCH (e)-[:SET_GOAL]->(g:Goal)
+            WHERE g.status <> 'Completed'
+            RETURN COUNT(g) AS active_goals_orphaned
+        }
+        RETURN {
+                   name: e.first_name + ' ' + e.last_name,
+                   level: e.job_level,
+                   dept: e.department_id
+               } AS employee,
+               direct_reports, indirect_report_count, employees_reviewed,
+               interviews_conducted, skills_lost, active_goals_orphaned
     """, eid=employee_id)
 
-    if not emp_info:
+    if not rows:
         return {"error": f"Employee {employee_id} not found"}
-
-    # Direct reports left without manager
-    direct_reports = conn.run("""
-        MATCH (report:Employee)-[:REPORTS_TO]->(e:Employee {employee_id: $eid})
-        RETURN report.employee_id AS id,
-               report.first_name + ' ' + report.last_name AS name,
-               report.job_level AS level
-    """, eid=employee_id)
-
-    # Indirect reports (2 levels deep)
-    indirect_reports = conn.run("""
-        MATCH (indirect:Employee)-[:REPORTS_TO*2]->(e:Employee {employee_id: $eid})
-        RETURN COUNT(indirect) AS count
-    """, eid=employee_id)
-
-    # Performance reviews this person gives (as reviewer)
-    reviews_given = conn.run("""
-        MATCH (r:PerformanceReview)-[:REVIEWED_BY]->(e:Employee {employee_id: $eid})
-        MATCH (emp:Employee)-[:REVIEWED_IN]->(r)
-        RETURN COUNT(DISTINCT emp) AS employees_reviewed
-    """, eid=employee_id)
-
-    # Interviews conducted
-    interviews = conn.run("""
-        MATCH (i:Interview)-[:INTERVIEWED_BY]->(e:Employee {employee_id: $eid})
-        RETURN COUNT(i) AS interview_count
-    """, eid=employee_id)
-
-    # Skills this person has (knowledge loss)
-    skills = conn.run("""
-        MATCH (e:Employee {employee_id: $eid})-[:HAS_SKILL]->(s:Skill)
-        RETURN s.name AS skill_name
-    """, eid=employee_id)
-
-    # Goals that would be orphaned
-    goals = conn.run("""
-        MATCH (e:Employee {employee_id: $eid})-[:SET_GOAL]->(g:Goal)
-        WHERE g.status <> 'Completed'
-        RETURN COUNT(g) AS active_goals
-    """, eid=employee_id)
-
-    return {
-        "employee": emp_info[0],
-        "direct_reports": direct_reports,
-        "indirect_report_count": indirect_reports[0]["count"] if indirect_reports else 0,
-        "employees_reviewed": reviews_given[0]["employees_reviewed"] if reviews_given else 0,
-        "interviews_conducted": interviews[0]["interview_count"] if interviews else 0,
-        "skills_lost": [s["skill_name"] for s in skills],
-        "active_goals_orphaned": goals[0]["active_goals"] if goals else 0,
-    }
+    return rows[0]
 
 
 def org_distance(conn: Neo4jConnection, emp1_id: str, emp2_id: str) -> dict:
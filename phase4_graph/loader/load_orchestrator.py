@@ -1,6 +1,7 @@
 """Full graph load pipeline: clear -> constrain -> load nodes -> load edges -> validate."""
 
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -9,6 +10,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from config.settings import GRAPH_LOAD_STAMP
 from phase3_ontology.constraints import generate_constraint_statements
 from phase4_graph.loader.neo4j_connection import Neo4jConnection
 from phase4_graph.loader.node_loader import load_all_nodes
@@ -60,6 +62,9 @@ def run_load_pipeline() -> bool:
     console.print("\n[yellow]Step 5: Validating...[/yellow]")
     total_nodes = conn.count_nodes()
     total_rels = conn.count_relationships()
+    # Reloads of the same synthetic data keep the same counts, so consumers
+    # caching derived output tell loads apart by this timestamp
+    GRAPH_LOAD_STAMP.write_text(datetime.now(timezone.utc).isoformat())
 
     # Print summary
     node_table = Table(title="Nodes Loaded")
@@ -6,7 +6,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from contextlib import contextmanager
-from neo4j import GraphDatabase
+from neo4j import GraphDatabase, Query
 from rich.console import Console
 
 from config.settings import NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD
@@ -17,8 +17,11 @@ console = Console()
 class Neo4jConnection:
     """Manages Neo4j driver lifecycle and provides session helpers."""
 
-    def __init__(self, uri: str = NEO4J_URI, user: str = NEO4J_USER, password: str = NEO4J_PASSWORD):
+    def __init__(self, uri: str = NEO4J_URI, user: str = NEO4J_USER, password: str = NEO4J_PASSWORD,
+                 query_timeout: float | None = None):
         self.driver = GraphDatabase.driver(uri, auth=(user, password))
+        # Server-side transaction timeout (seconds) for run()/run_with_summary()
+        self.query_timeout = query_timeout
 
     def close(self):
         self.driver.close()
@@ -35,19 +38,36 @@ class Neo4jConnection:
 
     @contextmanager
     def session(self):
-        """Yield a Neo4j session."""
-        session = self.driver.session()
+        """Yield a Neo4j session.
+
+        Sessions are cheap: the driver pools the underlying connections, so a
+        session per call costs no new Bolt handshake.
+        """
+        session = self.driver.session(fetch_size=1000)
         try:
             yield session
         finally:
             session.close()
 
+    def _query(self, cypher: str):
+        """Wrap a statement with the server-side timeout, if one is set."""
+        if self.query_timeout is None:
+            return cypher
+        return Query(cypher, timeout=self.query_timeout)
+
     def run(self, cypher: str, **params):
         """Execute a single Cypher statement and return the result."""
         with self.session() as session:
-            result = session.run(cypher, **params)
+            result = session.run(self._query(cypher), **params)
             return [record.data() for record in result]
 
+    def run_with_summary(self, cypher: str, **params):
+        """Execute a single Cypher statement and return (records, result summary)."""
+        with self.session() as session:
+            result = session.run(self._query(cypher), **params)
+            records = [record.data() for record in result]
+            return records, result.consume()
+
     def run_batch(self, cypher: str, batch: list[dict], batch_size: int = 1000) -> int:
         """Execute a parameterized Cypher statement in batches using UNWIND.
 
@@ -63,14 +83,15 @@ class Neo4jConnection:
         for i in range(0, len(batch), batch_size):
             chunk = batch[i:i + batch_size]
             with self.session() as session:
-                session.run(cypher, batch=chunk)
+                # Consume so a failed batch raises here, not on a later call
+                session.run(cypher, batch=chunk).consume()
             total += len(chunk)
         return total
 
     def clear_database(self):
         """Delete all nodes and relationships. Use with caution."""
         with self.session() as session:
-            session.run("MATCH (n) DETACH DELETE n")
+            session.run("MATCH (n) DETACH DELETE n").consume()
         console.print("[yellow]Database cleared.[/yellow]")
 
     def count_nodes(self, label: str = None) -> int:
@@ -0,0 +1,10 @@
+"""Streamlit app and Claude agent for querying the HR ontology."""
+
+import sys
+from pathlib import Path
+
+# config/ isn't one of the installed packages; put the project root on the
+# path once here so every module in this package can import it
+_ROOT = str(Path(__file__).parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
@@ -1,10 +1,5 @@
 """Streamlit app: HR Ontology AI Query Interface (multipage entry point)."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 import streamlit as st
 
 # Page config -- only allowed in the entry point
@@ -1,10 +1,5 @@
 """Claude AI agent with tool use for HR ontology queries."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 import json
 import anthropic
 
@@ -36,6 +31,10 @@ TOOLS = [
                     "type": "string",
                     "description": "A valid Cypher query. Use parameterized queries with $param syntax when possible."
                 },
+                "params": {
+                    "type": "object",
+                    "description": "Values for the $param placeholders in the query (e.g., {\"division\": \"Engineering\"})."
+                },
             },
             "required": ["cypher"],
         },
@@ -144,7 +143,7 @@ TOOLS = [
 
 # Map tool names to functions
 TOOL_FUNCTIONS = {
-    "query_graph": lambda inp: query_graph(inp["cypher"]),
+    "query_graph": lambda inp: query_graph(inp["cypher"], inp.get("params")),
     "query_data_lake": lambda inp: query_data_lake(inp["sql"]),
     "describe_ontology": lambda inp: describe_ontology(inp["entity_type"]),
     "visualize_subgraph": lambda inp: visualize_subgraph(inp["cypher"], inp.get("title", "subgraph")),
@@ -166,6 +165,8 @@ def _build_system_prompt() -> str:
         examples_text += f"Approach: {ex['approach']}\n"
         if "query" in ex:
             examples_text += f"```\n{ex['query'].strip()}\n```\n"
+        if "params" in ex:
+            examples_text += f"Params: {json.dumps(ex['params'])}\n"
         if "note" in ex:
             examples_text += f"Note: {ex['note']}\n"
     return SYSTEM_PROMPT + examples_text
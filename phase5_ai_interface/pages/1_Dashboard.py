@@ -1,18 +1,16 @@
 """Dashboard page: KPI bar, AI chat, and visualization panel."""
 
 import re
-import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 import json
 import streamlit as st
 
-from config.settings import EXPORTS_DIR
+# The phase5_ai_interface imports put the project root (and so config/) on the path
 from phase5_ai_interface.claude_agent import HRAgent
 from phase5_ai_interface.tools.cypher_tools import query_graph
 from phase5_ai_interface.tools.duckdb_tools import query_data_lake
+from config.settings import EXPORTS_DIR
 
 
 # ---------------------------------------------------------------------------
@@ -1,23 +1,13 @@
 """Employee Explorer page: drill into any employee's ontological data."""
 
-import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 import streamlit as st
 
 from phase5_ai_interface.tools.employee_queries import (
     get_employee_list,
-    get_employee_summary,
-    get_manager_chain,
-    get_direct_reports,
-    get_skills,
-    get_performance_reviews,
-    get_goals,
-    get_compensation,
-    get_temporal_events,
-    get_relationship_counts,
+    get_employee_full_profile,
+    startup_warmup,
 )
 from phase5_ai_interface.tools.ego_graph import build_ego_graph
 from phase4_graph.visualization.style_config import NODE_COLORS
@@ -37,13 +27,48 @@ def _safe_metric(label: str, value, fallback: str = "N/A"):
     st.metric(label, value if value else fallback)
 
 
+def _money(amount) -> str:
+    """Format a currency amount, or '?' if missing."""
+    return f"${amount:,.0f}" if amount else "?"
+
+
+@st.cache_data
+def _legend_html() -> str:
+    """Build the node color legend as one four-column HTML grid."""
+    items = "".join(
+        f'<div><span style="color:{color}">&#9679;</span> {label}</div>'
+        for label, color in NODE_COLORS.items()
+    )
+    return f'<div style="display:grid;grid-template-columns:repeat(4,1fr)">{items}</div>'
+
+
+def _table(rows: list[dict]):
+    """Render rows as one client-side table instead of a markdown call per row."""
+    st.dataframe(rows, hide_index=True, use_container_width=True)
+
+
+@st.cache_resource(show_spinner=False)
+def _warm_query_plans():
+    """Compile the Explorer's Cypher plans once per process, not per rerun."""
+    startup_warmup()
+
+
 # ── Employee list (cached) ───────────────────────────────────────────────────
 
+MAX_SEARCH_RESULTS = 20
+
+
 @st.cache_data(ttl=300, show_spinner="Loading employees...")
 def _load_employees():
-    return get_employee_list()
+    employees = []
+    # Format display/search strings once per cache fill rather than per rerun
+    for emp in get_employee_list():
+        display = _format_employee_option(emp)
+        employees.append({**emp, "_display": display, "_search": display.lower()})
+    return employees
 
 
+_warm_query_plans()
 employees = _load_employees()
 
 if not employees:
@@ -55,11 +80,22 @@ if not employees:
 
 st.header("Employee Explorer")
 
+# Only the top matches are sent to the selectbox so each rerun serializes a
+# handful of options instead of the whole employee list.
+search = st.text_input("Search employee", placeholder="Type a name, ID, or department...")
+needle = search.strip().lower()
+matches = [i for i, emp in enumerate(employees) if needle in emp["_search"]][:MAX_SEARCH_RESULTS]
+
+if not matches:
+    st.info(f"No employees match '{search}'.")
+    st.stop()
+
+st.caption(f"Showing {len(matches)} of {len(employees)} employees")
+
 selected_idx = st.selectbox(
-    "Search employee",
-    range(len(employees)),
-    format_func=lambda i: _format_employee_option(employees[i]),
-    placeholder="Type to search...",
+    "Select employee",
+    matches,
+    format_func=lambda i: employees[i]["_display"],
 )
 
 emp_id = employees[selected_idx]["id"]
@@ -67,7 +103,8 @@ emp_id = employees[selected_idx]["id"]
 
 # ── Summary cards ────────────────────────────────────────────────────────────
 
-summary = get_employee_summary(emp_id)
+bundle = get_employee_full_profile(emp_id)
+summary = bundle.get("summary")
 
 if not summary:
     st.error(f"Could not load data for {emp_id}")
@@ -110,17 +147,11 @@ with graph_col:
 
     # Color legend
     with st.expander("Node Color Legend", expanded=False):
-        legend_cols = st.columns(4)
-        for i, (label, color) in enumerate(NODE_COLORS.items()):
-            col = legend_cols[i % 4]
-            col.markdown(
-                f'<span style="color:{color}">&#9679;</span> {label}',
-                unsafe_allow_html=True,
-            )
+        st.markdown(_legend_html(), unsafe_allow_html=True)
 
 with rel_col:
     st.subheader("Relationships")
-    rel_counts = get_relationship_counts(emp_id)
+    rel_counts = bundle["rel_counts"]
     if rel_counts:
         total = sum(r["count"] for r in rel_counts)
         st.metric("Total Relationships", total)
@@ -146,7 +177,7 @@ with tab_org:
 
     with org_left:
         st.markdown("#### Manager Chain")
-        chain = get_manager_chain(emp_id)
+        chain = bundle["manager_chain"]
         if chain:
             for i, mgr in enumerate(chain):
                 indent = "\u2003" * i
@@ -158,34 +189,36 @@ with tab_org:
 
     with org_right:
         st.markdown("#### Direct Reports")
-        reports = get_direct_reports(emp_id)
+        reports = bundle["direct_reports"]
         if reports:
             st.caption(f"{len(reports)} direct report(s)")
-            for r in reports:
-                status_badge = "" if r.get("status") == "Active" else f" [{r.get('status')}]"
-                position = r.get("position") or ""
-                st.markdown(f"- **{r['name']}** -- {position} ({r.get('job_level', '')}){status_badge}")
+            _table([
+                {
+                    "Name": r["name"],
+                    "Position": r.get("position") or "",
+                    "Level": r.get("job_level") or "",
+                    "Status": r.get("status") or "",
+                }
+                for r in reports
+            ])
         else:
             st.caption("No direct reports (individual contributor).")
 
 
 # --- Skills ---
 with tab_skills:
-    skill_data = get_skills(emp_id)
+    skill_data = bundle["skills"]
     if skill_data:
-        # Group by category
-        categories = {}
-        for s in skill_data:
-            cat = s.get("category") or "Uncategorized"
-            categories.setdefault(cat, []).append(s)
-
-        for cat, skills_list in sorted(categories.items()):
-            st.markdown(f"#### {cat}")
-            for s in skills_list:
-                prof = s.get("proficiency") or "?"
-                assessed = s.get("assessed_date") or ""
-                assessed_str = f" (assessed {assessed})" if assessed else ""
-                st.markdown(f"- **{s['name']}** -- proficiency: {prof}{assessed_str}")
+        # Already ordered by category, then name
+        _table([
+            {
+                "Category": s.get("category") or "Uncategorized",
+                "Skill": s["name"],
+                "Proficiency": s.get("proficiency") or "?",
+                "Assessed": s.get("assessed_date") or "",
+            }
+            for s in skill_data
+        ])
     else:
         st.caption("No skills recorded for this employee.")
 
@@ -196,38 +229,41 @@ with tab_perf:
 
     with perf_left:
         st.markdown("#### Reviews")
-        reviews = get_performance_reviews(emp_id)
+        reviews = bundle["reviews"]
         if reviews:
-            for rev in reviews:
-                cycle = rev.get("cycle_name") or "N/A"
-                reviewer = rev.get("reviewer_name") or "N/A"
-                rating = rev.get("rating") or "?"
-                date = rev.get("review_date") or ""
-                st.markdown(f"**{cycle}** -- Rating: **{rating}** | Reviewer: {reviewer} | {date}")
-                if rev.get("comments"):
-                    st.caption(rev["comments"][:200])
+            _table([
+                {
+                    "Cycle": rev.get("cycle_name") or "N/A",
+                    "Rating": rev.get("rating"),
+                    "Reviewer": rev.get("reviewer_name") or "N/A",
+                    "Date": rev.get("review_date") or "",
+                    "Comments": (rev.get("comments") or "")[:200],
+                }
+                for rev in reviews
+            ])
         else:
             st.caption("No performance reviews found.")
 
     with perf_right:
         st.markdown("#### Goals")
-        goals = get_goals(emp_id)
+        goals = bundle["goals"]
         if goals:
-            for g in goals:
-                status = g.get("status") or "?"
-                achievement = g.get("achievement_pct")
-                ach_str = f" ({achievement}%)" if achievement is not None else ""
-                cycle = g.get("cycle_name") or ""
-                cycle_str = f" [{cycle}]" if cycle else ""
-                desc = g.get("description") or "No description"
-                st.markdown(f"- **{status}**{ach_str}{cycle_str}: {desc[:100]}")
+            _table([
+                {
+                    "Status": g.get("status") or "?",
+                    "Achievement %": g.get("achievement_pct"),
+                    "Cycle": g.get("cycle_name") or "",
+                    "Description": (g.get("description") or "No description")[:100],
+                }
+                for g in goals
+            ])
         else:
             st.caption("No goals found.")
 
 
 # --- Compensation ---
 with tab_comp:
-    comp = get_compensation(emp_id)
+    comp = bundle["compensation"]
 
     # Salary band context
     band = comp.get("salary_band", {})
@@ -246,12 +282,14 @@ with tab_comp:
         st.markdown("#### Salary History")
         salaries = comp.get("salaries", [])
         if salaries:
-            for s in salaries:
-                amount = s.get("amount")
-                amt_str = f"${amount:,.0f}" if amount else "?"
-                date = s.get("effective_date") or ""
-                freq = s.get("pay_frequency") or ""
-                st.markdown(f"- **{amt_str}** {freq} (effective {date})")
+            _table([
+                {
+                    "Amount": _money(s.get("amount")),
+                    "Frequency": s.get("pay_frequency") or "",
+                    "Effective": s.get("effective_date") or "",
+                }
+                for s in salaries
+            ])
         else:
             st.caption("No salary records.")
 
@@ -259,12 +297,14 @@ with tab_comp:
         st.markdown("#### Bonuses")
         bonuses = comp.get("bonuses", [])
         if bonuses:
-            for b in bonuses:
-                amount = b.get("amount")
-                amt_str = f"${amount:,.0f}" if amount else "?"
-                btype = b.get("type") or ""
-                date = b.get("payment_date") or ""
-                st.markdown(f"- **{amt_str}** {btype} ({date})")
+            _table([
+                {
+                    "Amount": _money(b.get("amount")),
+                    "Type": b.get("type") or "",
+                    "Paid": b.get("payment_date") or "",
+                }
+                for b in bonuses
+            ])
         else:
             st.caption("No bonus records.")
 
@@ -272,26 +312,31 @@ with tab_comp:
         st.markdown("#### Equity Grants")
         equity = comp.get("equity", [])
         if equity:
-            for eq in equity:
-                shares = eq.get("shares") or "?"
-                date = eq.get("grant_date") or ""
-                strike = eq.get("strike_price")
-                strike_str = f" @ ${strike}" if strike else ""
-                vesting = eq.get("vesting_schedule") or ""
-                st.markdown(f"- **{shares} shares**{strike_str} ({date}) {vesting}")
+            _table([
+                {
+                    "Shares": eq.get("shares"),
+                    "Strike": eq.get("strike_price"),
+                    "Granted": eq.get("grant_date") or "",
+                    "Vesting": eq.get("vesting_schedule") or "",
+                }
+                for eq in equity
+            ])
         else:
             st.caption("No equity grants.")
 
 
 # --- History ---
 with tab_hist:
-    events = get_temporal_events(emp_id)
+    events = bundle["events"]
     if events:
         st.markdown("#### Lifecycle Timeline")
-        for ev in events:
-            event_type = ev.get("event_type") or "Event"
-            date = ev.get("event_date") or ""
-            desc = ev.get("description") or ""
-            st.markdown(f"- **{date}** -- {event_type}: {desc}")
+        _table([
+            {
+                "Date": ev.get("event_date") or "",
+                "Event": ev.get("event_type") or "Event",
+                "Description": ev.get("description") or "",
+            }
+            for ev in events
+        ])
     else:
         st.caption("No lifecycle events recorded.")
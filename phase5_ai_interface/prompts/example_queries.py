@@ -1,12 +1,16 @@
-"""Few-shot examples mapping natural language questions to Cypher/SQL queries."""
+"""Few-shot examples mapping natural language questions to Cypher/SQL queries.
+
+Cypher examples bind literals through ``params`` so Neo4j can reuse one
+cached plan per query shape regardless of the values asked about.
+"""
 
 EXAMPLE_QUERIES = [
     {
         "question": "Who are the top flight risks in Engineering and what would happen if they left?",
         "approach": "graph",
         "query": """
-MATCH (e:Employee)-[:BELONGS_TO]->(d:Department)-[:PART_OF]->(div:Division {name: 'Engineering'})
-WHERE e.status = 'Active'
+MATCH (e:Employee)-[:BELONGS_TO]->(d:Department)-[:PART_OF]->(div:Division {name: $division})
+WHERE e.status = $status
 OPTIONAL MATCH (report:Employee)-[:REPORTS_TO]->(e)
 WITH e, d, COUNT(report) AS direct_reports
 OPTIONAL MATCH (e)-[:HAS_SKILL]->(s:Skill)
@@ -19,11 +23,17 @@ RETURN e.employee_id AS id, e.first_name + ' ' + e.last_name AS name,
        e.job_level AS level, d.name AS department,
        direct_reports, skill_count, impact_score
 """,
+        "params": {"division": "Engineering", "status": "Active"},
     },
     {
         "question": "Is there a pay equity gap by gender for senior engineers?",
         "approach": "sql",
         "query": """
+WITH latest AS (
+    SELECT employee_id, amount,
+           ROW_NUMBER() OVER (PARTITION BY employee_id ORDER BY effective_date DESC) AS rn
+    FROM base_salary
+)
 SELECT e.gender,
        e.job_level,
        COUNT(*) AS headcount,
@@ -32,15 +42,10 @@ SELECT e.gender,
        ROUND(MIN(bs.amount), 0) AS min_salary,
        ROUND(MAX(bs.amount), 0) AS max_salary
 FROM employees e
-JOIN base_salary bs ON e.employee_id = bs.employee_id
+JOIN latest bs ON e.employee_id = bs.employee_id AND bs.rn = 1
 WHERE e.status = 'Active'
   AND e.job_family = 'Software Engineering'
   AND e.job_level IN ('L3', 'L4', 'M1', 'M2')
-  AND bs.effective_date = (
-      SELECT MAX(bs2.effective_date)
-      FROM base_salary bs2
-      WHERE bs2.employee_id = e.employee_id
-  )
 GROUP BY e.gender, e.job_level
 ORDER BY e.job_level, e.gender
 """,
@@ -49,18 +54,27 @@ ORDER BY e.job_level, e.gender
         "question": "Which recruiting sources produce the highest-performing hires?",
         "approach": "sql",
         "query": """
-SELECT c.source,
-       COUNT(DISTINCT e.employee_id) AS hires,
-       ROUND(AVG(pr.rating), 2) AS avg_rating,
-       ROUND(AVG(CASE WHEN e.status = 'Terminated' THEN 1.0 ELSE 0.0 END) * 100, 1) AS turnover_pct
-FROM candidates c
-JOIN applications a ON c.candidate_id = a.candidate_id
-JOIN offers o ON a.application_id = o.application_id
-JOIN employees e ON e.email = c.email
-LEFT JOIN performance_reviews pr ON pr.employee_id = e.employee_id
-WHERE o.status = 'Accepted'
-GROUP BY c.source
-HAVING COUNT(DISTINCT e.employee_id) >= 3
+WITH emp_rating AS (
+    SELECT employee_id, AVG(rating) AS rating
+    FROM performance_reviews
+    GROUP BY employee_id
+),
+hired AS (
+    SELECT DISTINCT c.source, e.employee_id, e.status
+    FROM candidates c
+    JOIN applications a ON c.candidate_id = a.candidate_id
+    JOIN offers o ON a.application_id = o.application_id
+    JOIN employees e ON e.email = c.email
+    WHERE o.status = 'Accepted'
+)
+SELECT h.source,
+       COUNT(*) AS hires,
+       ROUND(AVG(er.rating), 2) AS avg_rating,
+       ROUND(AVG(CASE WHEN h.status = 'Terminated' THEN 1.0 ELSE 0.0 END) * 100, 1) AS turnover_pct
+FROM hired h
+LEFT JOIN emp_rating er ON er.employee_id = h.employee_id
+GROUP BY h.source
+HAVING COUNT(*) >= 3
 ORDER BY avg_rating DESC
 """,
     },
@@ -69,7 +83,7 @@ ORDER BY avg_rating DESC
         "approach": "graph",
         "query": """
 MATCH (manager:Employee)<-[:REPORTS_TO]-(report:Employee)
-WHERE manager.status = 'Active'
+WHERE manager.status = $status
 WITH manager, COUNT(report) AS direct_reports
 ORDER BY direct_reports DESC
 LIMIT 15
@@ -80,13 +94,14 @@ RETURN manager.employee_id AS id,
        d.name AS department,
        direct_reports
 """,
+        "params": {"status": "Active"},
     },
     {
         "question": "What skills are most common among top performers?",
         "approach": "graph",
         "query": """
 MATCH (e:Employee)-[:REVIEWED_IN]->(r:PerformanceReview)
-WHERE r.rating >= 4.0 AND e.status = 'Active'
+WHERE r.rating >= $min_rating AND e.status = $status
 WITH DISTINCT e
 MATCH (e)-[:HAS_SKILL]->(s:Skill)
 WITH s.name AS skill, s.category AS category, COUNT(DISTINCT e) AS top_performer_count
@@ -94,6 +109,7 @@ ORDER BY top_performer_count DESC
 LIMIT 15
 RETURN skill, category, top_performer_count
 """,
+        "params": {"min_rating": 4.0, "status": "Active"},
     },
     {
         "question": "If our VP of Engineering leaves, map the full organizational impact",
@@ -120,14 +136,18 @@ ORDER BY e.gender
         "question": "Which departments have the most cross-department skill overlap?",
         "approach": "graph",
         "query": """
-MATCH (e1:Employee)-[:HAS_SKILL]->(s:Skill)<-[:HAS_SKILL]-(e2:Employee)
-WHERE e1.department_id < e2.department_id
-  AND e1.status = 'Active' AND e2.status = 'Active'
-WITH e1.department_id AS dept1, e2.department_id AS dept2,
-     COUNT(DISTINCT s) AS shared_skills
+MATCH (e:Employee)-[:HAS_SKILL]->(s:Skill)
+WHERE e.status = $status
+WITH s, COLLECT(DISTINCT e.department_id) AS depts
+UNWIND depts AS dept1
+UNWIND depts AS dept2
+WITH dept1, dept2, s
+WHERE dept1 < dept2
+WITH dept1, dept2, COUNT(DISTINCT s) AS shared_skills
 ORDER BY shared_skills DESC
 LIMIT 10
 RETURN dept1, dept2, shared_skills
 """,
+        "params": {"status": "Active"},
     },
 ]
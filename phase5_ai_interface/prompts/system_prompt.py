@@ -29,7 +29,7 @@ You can answer complex organizational questions by querying:
 ## Graph Schema
 
 ### Node Types (22 types, 37,277 total)
-- **Employee** (735): employee_id, first_name, last_name, email, hire_date, gender, ethnicity, job_level, job_family, status, department_id, position_id, manager_id, location_id
+- **Employee** (735): employee_id, first_name, last_name, full_name, email, hire_date, gender, ethnicity, job_level, job_family, status, department_id, position_id, manager_id, location_id
 - **Candidate** (5,243): candidate_id, name, email, source
 - **Department** (20): dept_id, name, division_id
 - **Division** (5): division_id, name
@@ -91,6 +91,13 @@ You can answer complex organizational questions by querying:
 **Lifecycle:**
 - (Employee)-[:EXPERIENCED_EVENT]->(TemporalEvent) — 1,065
 
+### Indexes
+Equality and range lookups on these properties use an index seek instead of a label scan, so anchor MATCH patterns on them where possible:
+- Every node type's ID property (unique constraint), e.g. Employee.employee_id, Skill.skill_id
+- Employee.status, Employee.job_family, Employee.department_id, Employee.email
+- Division.name, Department.name, Skill.name
+- PerformanceReview.rating
+
 ## Data Lake Tables
 Accessible via SQL with these table aliases:
 - employees, departments, positions, locations, employment_history
@@ -0,0 +1,50 @@
+"""Small in-process TTL cache for tool results that are requested repeatedly."""
+
+import functools
+import json
+import threading
+import time
+from collections import OrderedDict
+
+
+def cached(ttl_seconds: float = 60, maxsize: int = 256, cache_if=None):
+    """Cache a function's return value per call arguments for ttl_seconds.
+
+    Keys are (function name, JSON of args/kwargs), so arguments only need to
+    be JSON-serializable, not hashable. Entries are evicted least-recently-used
+    once maxsize is reached. If cache_if is given, a value is only stored when
+    cache_if(value) is true. Cached values are shared between callers and
+    must not be mutated.
+    """
+    def decorator(func):
+        store: OrderedDict = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__name__, json.dumps([args, kwargs], sort_keys=True, default=str))
+            now = time.monotonic()
+            with lock:
+                entry = store.get(key)
+                if entry is not None and entry[0] > now:
+                    store.move_to_end(key)
+                    return entry[1]
+
+            value = func(*args, **kwargs)
+            if cache_if is not None and not cache_if(value):
+                return value
+            with lock:
+                store[key] = (now + ttl_seconds, value)
+                store.move_to_end(key)
+                while len(store) > maxsize:
+                    store.popitem(last=False)
+            return value
+
+        def cache_clear():
+            with lock:
+                store.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -0,0 +1,40 @@
+"""Process-wide Neo4j connection shared by every tool module."""
+
+import threading
+
+from phase4_graph.loader.neo4j_connection import Neo4jConnection
+
+_lock = threading.Lock()
+_conn: Neo4jConnection | None = None
+_verified = False
+
+
+def get_conn() -> Neo4jConnection:
+    """Return the shared Neo4j connection (one driver and Bolt pool per process).
+
+    The lock keeps concurrent first calls from opening a second pool.
+    """
+    global _conn
+    with _lock:
+        if _conn is None:
+            _conn = Neo4jConnection()
+        return _conn
+
+
+def set_query_timeout(seconds: float | None):
+    """Have Neo4j abort queries on the shared connection after seconds (None disables)."""
+    get_conn().query_timeout = seconds
+
+
+def is_verified() -> bool:
+    """Whether the shared connection can reach Neo4j.
+
+    Connectivity is re-checked on every call until it succeeds once, so a
+    server that was down at startup is picked up when it comes back.
+    """
+    global _verified
+    conn = get_conn()
+    with _lock:
+        if not _verified:
+            _verified = conn.verify()
+        return _verified
@@ -0,0 +1,89 @@
+"""Write Pyvis networks to HTML without building the whole page in memory."""
+
+from pathlib import Path
+
+from jinja2.utils import htmlsafe_json_dumps
+from pyvis.network import Network
+
+CHUNK_SIZE = 500
+
+_NODES_SLOT = "nodes = new vis.DataSet([]);"
+_EDGES_SLOT = "edges = new vis.DataSet([]);"
+
+
+class _Slot(list):
+    """Empty list that reports the real item count.
+
+    Rendered in place of net.nodes/net.edges so the template serializes `[]`
+    (which we then fill in chunks) while `|length` checks such as the
+    >100-node loading bar still see the true size.
+    """
+
+    def __init__(self, size: int):
+        super().__init__()
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+
+def _write_items(f, items: list[dict], chunk_size: int) -> None:
+    """Stream a JSON array of items, serializing chunk_size objects at a time."""
+    f.write("[")
+    for start in range(0, len(items), chunk_size):
+        if start:
+            f.write(", ")
+        # Same escaping as the template's |tojson so tooltips can't close <script>
+        f.write(", ".join(
+            htmlsafe_json_dumps(item, sort_keys=True)
+            for item in items[start:start + chunk_size]
+        ))
+    f.write("]")
+
+
+def write_html_chunked(net: Network, path: Path, chunk_size: int = CHUNK_SIZE,
+                       replacements: dict[str, str] | None = None) -> None:
+    """Write net to path, streaming node/edge JSON in chunk_size batches.
+
+    The page shell is rendered once with empty data slots; nodes and edges are
+    then written straight to the file, so peak memory is one chunk of JSON
+    rather than the full page string. The output is the same self-contained
+    HTML that net.write_html() produces, so it still embeds in Streamlit.
+
+    Args:
+        net: Populated Pyvis network.
+        path: Destination HTML file.
+        chunk_size: Nodes/edges serialized per write.
+        replacements: Optional {old: new} text substitutions applied once each
+            to the page shell (e.g. injecting extra JS).
+    """
+    nodes, edges = net.nodes, net.edges
+    # Tooltips with links switch pyvis to a different template; keep its path.
+    if any("href" in (n.get("title") or "") for n in nodes):
+        html = net.generate_html()
+        for old, new in (replacements or {}).items():
+            html = html.replace(old, new, 1)
+        path.write_text(html, encoding="utf-8")
+        return
+
+    net.nodes, net.edges = _Slot(len(nodes)), _Slot(len(edges))
+    try:
+        shell = net.generate_html()
+    finally:
+        net.nodes, net.edges = nodes, edges
+        net.html = ""
+    for old, new in (replacements or {}).items():
+        shell = shell.replace(old, new, 1)
+
+    head, rest = shell.split(_NODES_SLOT, 1)
+    middle, tail = rest.split(_EDGES_SLOT, 1)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(head)
+        f.write("nodes = new vis.DataSet(")
+        _write_items(f, nodes, chunk_size)
+        f.write(");")
+        f.write(middle)
+        f.write("edges = new vis.DataSet(")
+        _write_items(f, edges, chunk_size)
+        f.write(");")
+        f.write(tail)
@@ -0,0 +1,87 @@
+"""Precompute Pyvis layouts in Python for graphs too large to simulate in the browser."""
+
+import math
+
+import networkx as nx
+import numpy as np
+from pyvis.network import Network
+
+OFFLINE_LAYOUT_THRESHOLD = 500
+# The numpy fallback holds n x n x 2 arrays, so past this size a circle is used
+DENSE_LAYOUT_MAX_NODES = 600
+
+
+def _numpy_spring_layout(graph: nx.Graph, scale: float, iterations: int = 50) -> dict:
+    """Vectorized Fruchterman-Reingold over a dense adjacency matrix.
+
+    Used when scipy is missing: networkx's spring_layout insists on its sparse
+    solver from 500 nodes up.
+    """
+    n = len(graph)
+    adj = nx.to_numpy_array(graph)
+    pos = np.random.default_rng(42).random((n, 2))
+    k = math.sqrt(1.0 / n)
+    temp = 0.1
+    cooling = temp / (iterations + 1)
+    for _ in range(iterations):
+        delta = pos[:, None, :] - pos[None, :, :]
+        dist = np.clip(np.linalg.norm(delta, axis=-1), 0.01, None)
+        # Repulsion between every pair, attraction along edges
+        disp = np.einsum("ijk,ij->ik", delta, k * k / dist**2 - adj * dist / k)
+        length = np.linalg.norm(disp, axis=-1)
+        length[length < 0.01] = 0.1
+        pos += disp * (temp / length)[:, None]
+        temp -= cooling
+    pos -= pos.mean(axis=0)
+    pos *= scale / max(np.abs(pos).max(), 1e-9)
+    return dict(zip(graph, pos))
+
+
+def _grid_positions(graph: nx.Graph, spacing: float = 100) -> dict:
+    """Place nodes on a square grid in O(n); for graphs with nothing to pull together."""
+    cols = math.ceil(math.sqrt(len(graph)))
+    return {node: ((i % cols) * spacing, (i // cols) * spacing) for i, node in enumerate(graph)}
+
+
+def _positions(graph: nx.Graph) -> dict:
+    """Node -> (x, y) in vis.js pixel units."""
+    if graph.number_of_edges() == 0:
+        return _grid_positions(graph)
+    try:
+        # sfdp is the fastest option but needs pygraphviz plus the Graphviz binaries
+        return nx.nx_agraph.graphviz_layout(graph, prog="sfdp")
+    except Exception:
+        pass
+    # Spread roughly 100px per node along each axis of a square canvas
+    scale = 50 * math.sqrt(len(graph))
+    try:
+        return nx.spring_layout(graph, scale=scale, seed=42)
+    except ImportError:
+        if len(graph) > DENSE_LAYOUT_MAX_NODES:
+            return nx.circular_layout(graph, scale=scale)
+        return _numpy_spring_layout(graph, scale)
+
+
+def apply_offline_layout(net: Network, threshold: int = OFFLINE_LAYOUT_THRESHOLD) -> bool:
+    """Pin every node to a precomputed position when the network is large.
+
+    Above threshold nodes, positions are computed here and physics is switched
+    off, so the browser only draws the graph instead of running a force
+    simulation over it.
+
+    Returns:
+        True if a layout was applied, False if the network was left as is.
+    """
+    if len(net.nodes) <= threshold:
+        return False
+
+    graph = nx.Graph()
+    graph.add_nodes_from(net.node_ids)
+    graph.add_edges_from((edge["from"], edge["to"]) for edge in net.edges)
+    pos = _positions(graph)
+    for node in net.nodes:
+        x, y = pos[node["id"]]
+        node["x"], node["y"] = float(x), float(y)
+        node["physics"] = False
+    net.toggle_physics(False)
+    return True
@@ -1,27 +1,143 @@
 """Execute Cypher queries against Neo4j."""
 
-import sys
-from pathlib import Path
+import threading
+from collections.abc import Iterable
+import orjson
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-import json
+from phase3_ontology.constraints import generate_lookup_index_statements
 from phase4_graph.loader.neo4j_connection import Neo4jConnection
+from phase5_ai_interface.tools._cache import cached
+from phase5_ai_interface.tools._driver import get_conn, is_verified
+from phase5_ai_interface.prompts.example_queries import EXAMPLE_QUERIES
+
 
-_conn = None
+def _ensure_lookup_indexes(conn: Neo4jConnection):
+    """Create the indexes the agent's lookups rely on (no-op if they exist)."""
+    for stmt in generate_lookup_index_statements():
+        try:
+            conn.run(stmt)
+        except Exception:
+            pass  # Read-only users or older servers: queries still work, just slower
+
+
+def _warmup(conn: Neo4jConnection):
+    """Pull the graph into the page cache and seed the plan cache with the examples."""
+    try:
+        conn.run("CALL apoc.warmup.run(true, true, true)")
+    except Exception:
+        # apoc.warmup is not in APOC core for Neo4j 5; touching every node and
+        # outgoing relationship loads the same store pages.
+        try:
+            conn.run("""
+                MATCH (n)
+                OPTIONAL MATCH (n)-[r]->()
+                RETURN count(n) + count(r) AS touched
+            """)
+        except Exception:
+            return
+
+    warm_plans(
+        ((ex["query"], ex.get("params", {})) for ex in EXAMPLE_QUERIES if ex["approach"] == "graph"),
+        conn,
+    )
+
+
+def warm_plans(queries: Iterable[tuple[str, dict]], conn: Neo4jConnection | None = None):
+    """EXPLAIN each (cypher, params) pair so Neo4j caches its plan without running it."""
+    conn = conn or _get_conn()
+    for cypher, params in queries:
+        try:
+            conn.run("EXPLAIN " + cypher, **params)
+        except Exception:
+            pass
+
+
+_setup_lock = threading.Lock()
+_setup_done = False
 
 
 def _get_conn() -> Neo4jConnection:
-    global _conn
-    if _conn is None:
-        _conn = Neo4jConnection()
-        _conn.verify()
-    return _conn
+    """Return the shared Neo4j connection, setting up indexes and warmup once it is reachable."""
+    global _setup_done
+    conn = get_conn()
+    if not _setup_done:
+        with _setup_lock:
+            if not _setup_done and is_verified():
+                _ensure_lookup_indexes(conn)
+                # Warm caches in the background so app startup isn't blocked
+                threading.Thread(target=_warmup, args=(conn,), daemon=True).start()
+                _setup_done = True
+    return conn
+
+
+def _to_serializable(val):
+    """Convert a Neo4j value to a JSON-friendly scalar."""
+    if hasattr(val, 'isoformat'):
+        return val.isoformat()
+    if val is None or isinstance(val, (str, int, float, bool)):
+        return val
+    return str(val)
+
+
+def _orjson_default(val):
+    """Serialize values orjson doesn't handle natively (Neo4j temporal types, spatial, etc.)."""
+    if hasattr(val, 'isoformat'):
+        return val.isoformat()
+    return str(val)
+
+
+def _dumps(obj) -> str:
+    """Encode an object as a JSON string."""
+    return orjson.dumps(obj, default=_orjson_default).decode()
+
+
+def _to_native(val):
+    """Recursively convert a Neo4j value to plain Python (the shape json.loads would give)."""
+    if isinstance(val, dict):
+        return {k: _to_native(v) for k, v in val.items()}
+    if isinstance(val, list):
+        return [_to_native(v) for v in val]
+    return _to_serializable(val)
+
+
+# Only results the planner reports as read-only ("r") are cached, so a
+# repeated CREATE or MERGE runs every time
+@cached(ttl_seconds=60, maxsize=128, cache_if=lambda result: result[1])
+def _records_cached(cypher: str, params: dict) -> tuple[tuple, bool]:
+    """Run a query and convert its records; repeat read queries hit the cache.
+
+    Returns (records, read_only). Errors propagate instead of being cached so
+    a failed query is retried next time.
+    """
+    records, summary = _get_conn().run_with_summary(cypher, **params)
+    rows = tuple({k: _to_native(v) for k, v in record.items()} for record in records)
+    return rows, summary.query_type == "r"
+
+
+def query_graph_records(cypher: str, params: dict | None = None) -> list[dict]:
+    """Execute a query and return the records as plain Python dicts.
+
+    Same caching and value conversion as query_graph, without the JSON
+    round-trip; for in-process callers such as the Explorer page. The
+    returned dicts are shared with the cache and must not be mutated.
+
+    Args:
+        cypher: A valid Cypher query string.
+        params: Optional parameter dict for parameterized queries.
+
+    Returns:
+        List of record dicts. Raises if the query fails.
+    """
+    rows, _ = _records_cached(cypher, params or {})
+    return list(rows)
 
 
 def query_graph(cypher: str, params: dict | None = None) -> str:
     """Execute a Cypher query against Neo4j and return results as JSON.
 
+    Read-only results are cached for 60 seconds per (cypher, params);
+    writes always run.
+
     Args:
         cypher: A valid Cypher query string.
         params: Optional parameter dict for parameterized queries.
@@ -30,56 +146,64 @@ def query_graph(cypher: str, params: dict | None = None) -> str:
         JSON string with query results or error message.
     """
     try:
-        conn = _get_conn()
-        results = conn.run(cypher, **(params or {}))
-
-        if not results:
-            return json.dumps({"rows": [], "count": 0})
-
-        # Convert results to serializable format
-        rows = []
-        for record in results:
-            row = {}
-            for key, val in record.items():
-                if hasattr(val, 'isoformat'):
-                    row[key] = val.isoformat()
-                elif val is None or isinstance(val, (str, int, float, bool)):
-                    row[key] = val
-                else:
-                    row[key] = str(val)
-            rows.append(row)
-
-        return json.dumps({"rows": rows, "count": len(rows)}, indent=2)
-
+        rows = query_graph_records(cypher, params)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
+    return _dumps({"rows": rows, "count": len(rows)})
+
+
+def _count_store_union(names_query: str, name_col: str, pattern: str) -> str:
+    """Build a UNION ALL of per-name count-store lookups, one branch per label/type."""
+    rows = orjson.loads(query_graph(names_query)).get("rows", [])
+    return "\nUNION ALL\n".join(
+        f"MATCH {pattern.format(name=row['name'])} "
+        f"RETURN '{row['name']}' AS {name_col}, count(*) AS count"
+        for row in rows
+    )
 
 
 def get_node_counts() -> str:
-    """Get counts of all node types in the graph."""
-    return query_graph("""
-        CALL db.labels() YIELD label
-        CALL {
-            WITH label
-            MATCH (n)
-            WHERE label IN labels(n)
-            RETURN count(n) AS count
-        }
-        RETURN label, count
+    """Get counts of all node types in the graph.
+
+    Reads the precomputed counters from apoc.meta.stats(); without APOC,
+    falls back to one count-store lookup per label.
+    """
+    result = query_graph("""
+        CALL apoc.meta.stats() YIELD labels
+        UNWIND keys(labels) AS label
+        RETURN label, labels[label] AS count
         ORDER BY count DESC
     """)
+    if "error" not in orjson.loads(result):
+        return result
+
+    union = _count_store_union(
+        "CALL db.labels() YIELD label RETURN label AS name", "label", "(n:`{name}`)",
+    )
+    if not union:
+        return _dumps({"rows": [], "count": 0})
+    return query_graph(f"CALL {{\n{union}\n}}\nRETURN label, count ORDER BY count DESC")
 
 
 def get_relationship_counts() -> str:
-    """Get counts of all relationship types in the graph."""
-    return query_graph("""
-        CALL db.relationshipTypes() YIELD relationshipType AS type
-        CALL {
-            WITH type
-            MATCH ()-[r]->()
-            WHERE type(r) = type
-            RETURN count(r) AS count
-        }
-        RETURN type, count
+    """Get counts of all relationship types in the graph.
+
+    Reads the precomputed counters from apoc.meta.stats(); without APOC,
+    falls back to one count-store lookup per relationship type.
+    """
+    result = query_graph("""
+        CALL apoc.meta.stats() YIELD relTypesCount
+        UNWIND keys(relTypesCount) AS type
+        RETURN type, relTypesCount[type] AS count
         ORDER BY count DESC
     """)
+    if "error" not in orjson.loads(result):
+        return result
+
+    union = _count_store_union(
+        "CALL db.relationshipTypes() YIELD relationshipType RETURN relationshipType AS name",
+        "type", "()-[:`{name}`]->()",
+    )
+    if not union:
+        return _dumps({"rows": [], "count": 0})
+    return query_graph(f"CALL {{\n{union}\n}}\nRETURN type, count ORDER BY count DESC")
@@ -1,29 +1,196 @@
 """Execute SQL queries against the DuckDB data lake."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-import json
-import math
+import re
+import threading
+from contextlib import contextmanager
 import duckdb
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from config.settings import LAKE_DATA_DIR
+from phase5_ai_interface.tools._cache import cached
+
+# Table aliases registered as views over the lake's Parquet files
+TABLES = {
+    "employees": "hris/employees",
+    "departments": "hris/departments",
+    "positions": "hris/positions",
+    "locations": "hris/locations",
+    "employment_history": "hris/employment_history",
+    "requisitions": "ats/requisitions",
+    "candidates": "ats/candidates",
+    "applications": "ats/applications",
+    "interviews": "ats/interviews",
+    "offers": "ats/offers",
+    "performance_cycles": "performance/performance_cycles",
+    "goals": "performance/goals",
+    "performance_reviews": "performance/performance_reviews",
+    "competency_assessments": "performance/competency_assessments",
+    "salary_bands": "compensation/salary_bands",
+    "base_salary": "compensation/base_salary",
+    "bonuses": "compensation/bonuses",
+    "equity_grants": "compensation/equity_grants",
+}
+
+# Maximum rows returned to the caller; one extra row is fetched to detect truncation
+MAX_ROWS = 200
+
+
+_con: duckdb.DuckDBPyConnection | None = None
+_con_lock = threading.Lock()
+# Aliases with a view on _con; the rest are retried on every query
+_registered: set[str] = set()
+
+
+def _get_con() -> duckdb.DuckDBPyConnection:
+    """Return the process-wide in-memory connection with the lake views registered.
+
+    Views are only created for Parquet files that exist, so each call
+    registers any the lake has gained since; a view reads its file at query
+    time, so rebuilt files are picked up without re-registering.
+    """
+    global _con
+    with _con_lock:
+        if _con is None:
+            _con = duckdb.connect(":memory:")
+        for alias, path in TABLES.items():
+            if alias in _registered:
+                continue
+            parquet_path = LAKE_DATA_DIR / f"{path}.parquet"
+            if parquet_path.exists():
+                _con.execute(f"CREATE OR REPLACE VIEW {alias} AS SELECT * FROM '{parquet_path}'")
+                _registered.add(alias)
+        return _con
 
 
-def _clean_value(v):
-    """Make a value JSON-serializable."""
-    if v is None:
-        return None
-    if isinstance(v, float) and (math.isnan(v) or math.isinf(v)):
+_query_timeout: float | None = None
+
+
+def set_query_timeout(seconds: float | None):
+    """Interrupt lake queries that run longer than seconds (None disables)."""
+    global _query_timeout
+    _query_timeout = seconds
+
+
+@contextmanager
+def _cursor():
+    """Yield a cursor on the shared database, interrupted if it outlives the query timeout.
+
+    Each call gets its own cursor so concurrent Streamlit sessions don't step
+    on each other's result sets.
+    """
+    con = _get_con().cursor()
+    timer = None
+    if _query_timeout is not None:
+        timer = threading.Timer(_query_timeout, con.interrupt)
+        timer.daemon = True
+        timer.start()
+    try:
+        yield con
+    finally:
+        if timer is not None:
+            timer.cancel()
+        con.close()
+
+
+def _column_converter(typ: pa.DataType):
+    """Pick a vectorized cast that makes a column JSON-friendly, or None if it already is."""
+    if pa.types.is_timestamp(typ):
+        # Lake dates are stored as timestamps; report them as plain dates
+        return lambda col: pc.cast(pc.cast(col, pa.date32(), safe=False), pa.string())
+    if pa.types.is_date(typ) or pa.types.is_time(typ):
+        return lambda col: pc.cast(col, pa.string())
+    if pa.types.is_decimal(typ):
+        return lambda col: pc.cast(col, pa.float64())
+    if pa.types.is_floating(typ):
+        return lambda col: pc.if_else(pc.is_nan(col), pa.scalar(None, typ), col)
+    if pa.types.is_interval(typ):
+        # Arrow can't cast intervals; render them as ISO 8601 durations
+        return lambda col: pa.array(
+            [None if v is None else _iso_duration(v) for v in col.to_pylist()], pa.string(),
+        )
+    return None
+
+
+def _iso_duration(interval) -> str:
+    """Format an Arrow MonthDayNano interval as an ISO 8601 duration (e.g. P1M2DT3.5S)."""
+    return f"P{interval.months}M{interval.days}DT{interval.nanoseconds / 1e9:g}S"
+
+
+def _convert_columns(tbl: pa.Table) -> pa.Table:
+    """Apply one converter per column, chosen once from the schema."""
+    for i, field in enumerate(tbl.schema):
+        convert = _column_converter(field.type)
+        if convert is not None:
+            tbl = tbl.set_column(i, field.name, convert(tbl.column(i)))
+    return tbl
+
+
+_SELECT_HEAD = re.compile(r"\s*\(*\s*(?:select|with)\b", re.I)
+
+
+def _wrappable(sql: str) -> str | None:
+    """Return sql cut before its trailing semicolons if it is a single SELECT/WITH query, else None.
+
+    Trailing comments can stay: the wrapper puts the closing parenthesis on
+    its own line, and the tokenizer already skips them when finding the cut.
+    """
+    try:
+        statements = duckdb.extract_statements(sql)
+    except Exception:
+        return None  # Let execute() report the parse error on the original text
+    if len(statements) != 1 or not _SELECT_HEAD.match(sql):
         return None
-    if isinstance(v, pd.Timestamp):
-        return str(v.date()) if not pd.isna(v) else None
-    if hasattr(v, 'item'):
-        return v.item()
-    return v
+    cut = len(sql)
+    for offset, _ in reversed(duckdb.tokenize(sql)):
+        if sql[offset] != ";":
+            break
+        cut = offset
+    return sql[:cut]
+
+
+def _fetch_capped(con, sql: str) -> pa.Table:
+    """Run sql and return at most MAX_ROWS + 1 rows as an Arrow table."""
+    query = _wrappable(sql)
+    if query is not None:
+        # Push the row cap into the query so DuckDB stops after MAX_ROWS + 1
+        # rows instead of materializing the full result.
+        wrapped = f"SELECT * FROM (\n{query}\n) _user_q LIMIT {MAX_ROWS + 1}"
+        return con.execute(wrapped).fetch_arrow_table()
+
+    # PRAGMAs, multi-statement scripts etc. run as written; only the first
+    # MAX_ROWS + 1 rows of the last statement's result are read.
+    reader = con.execute(sql).fetch_record_batch(MAX_ROWS + 1)
+    batches, n = [], 0
+    for batch in reader:
+        batches.append(batch)
+        n += batch.num_rows
+        if n > MAX_ROWS:
+            break
+    return pa.Table.from_batches(batches, reader.schema).slice(0, MAX_ROWS + 1)
+
+
+@cached(ttl_seconds=60, maxsize=128)
+def _query_cached(sql: str) -> str:
+    """Run a query and serialize the result; identical SQL text is served from cache for 60s.
+
+    Errors propagate instead of being cached so a failed query is retried next time.
+    """
+    with _cursor() as con:
+        tbl = _fetch_capped(con, sql)
+
+    # Limit to 200 rows to avoid huge responses. Arrow converts nulls to
+    # None column-wise, so no per-cell cleanup pass is needed.
+    truncated = tbl.num_rows > MAX_ROWS
+    rows = _convert_columns(tbl.slice(0, MAX_ROWS)).to_pylist()
+
+    result = {"rows": rows, "count": len(rows)}
+    if truncated:
+        result["note"] = "Results truncated to 200 rows. Add LIMIT to your query for smaller results."
+
+    return orjson.dumps(result, default=str).decode()
 
 
 def query_data_lake(sql: str) -> str:
@@ -38,6 +205,9 @@ def query_data_lake(sql: str) -> str:
     Use paths like: SELECT * FROM 'data/lake/hris/employees.parquet'
     Or use the pre-registered views if available.
 
+    Results are cached per SQL text for 60 seconds, so a rebuilt lake is
+    picked up within a minute.
+
     Args:
         sql: A valid DuckDB SQL query.
 
@@ -45,52 +215,22 @@ def query_data_lake(sql: str) -> str:
         JSON string with query results or error message.
     """
     try:
-        con = duckdb.connect()
-
-        # Register common table aliases for convenience
-        tables = {
-            "employees": "hris/employees",
-            "departments": "hris/departments",
-            "positions": "hris/positions",
-            "locations": "hris/locations",
-            "employment_history": "hris/employment_history",
-            "requisitions": "ats/requisitions",
-            "candidates": "ats/candidates",
-            "applications": "ats/applications",
-            "interviews": "ats/interviews",
-            "offers": "ats/offers",
-            "performance_cycles": "performance/performance_cycles",
-            "goals": "performance/goals",
-            "performance_reviews": "performance/performance_reviews",
-            "competency_assessments": "performance/competency_assessments",
-            "salary_bands": "compensation/salary_bands",
-            "base_salary": "compensation/base_salary",
-            "bonuses": "compensation/bonuses",
-            "equity_grants": "compensation/equity_grants",
-        }
-
-        for alias, path in tables.items():
-            parquet_path = LAKE_DATA_DIR / f"{path}.parquet"
-            if parquet_path.exists():
-                con.execute(f"CREATE VIEW {alias} AS SELECT * FROM '{parquet_path}'")
-
-        df = con.execute(sql).fetchdf()
-        con.close()
+        return _query_cached(sql)
+    except Exception as e:
+        return orjson.dumps({"error": str(e)}).decode()
 
-        rows = []
-        for _, record in df.iterrows():
-            row = {col: _clean_value(record[col]) for col in df.columns}
-            rows.append(row)
 
-        # Limit to 200 rows to avoid huge responses
-        truncated = len(rows) > 200
-        rows = rows[:200]
+def query_data_lake_frame(sql: str) -> pd.DataFrame:
+    """Execute a SQL query against the data lake and return a DataFrame.
 
-        result = {"rows": rows, "count": len(rows)}
-        if truncated:
-            result["note"] = "Results truncated to 200 rows. Add LIMIT to your query for smaller results."
+    Unlike query_data_lake the result is neither capped at MAX_ROWS nor
+    cached; for in-process callers that aggregate raw rows locally.
 
-        return json.dumps(result, indent=2, default=str)
+    Args:
+        sql: A valid DuckDB SQL query.
 
-    except Exception as e:
-        return json.dumps({"error": str(e)})
+    Returns:
+        The full result set. Raises if the query fails.
+    """
+    with _cursor() as con:
+        return con.execute(sql).df()
@@ -1,66 +1,186 @@
 """Build interactive Pyvis ego-graphs for individual employees."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from pyvis.network import Network
 
 from config.settings import EXPORTS_DIR
-from phase4_graph.loader.neo4j_connection import Neo4jConnection
+from phase5_ai_interface.tools._driver import get_conn
+from phase5_ai_interface.tools._html_export import write_html_chunked
+from phase5_ai_interface.tools._layout import apply_offline_layout
 from phase4_graph.visualization.style_config import (
     node_color, node_size, edge_color, NODE_COLORS,
 )
 
-_conn = None
+# Relationship types followed when expanding the neighborhood. Leaving out the
+# hub-heavy ones (e.g. PART_OF, IN_JOB_FAMILY) keeps a manager's 2-hop graph small.
+DEFAULT_ALLOWED_RELS = [
+    "REPORTS_TO", "BELONGS_TO", "HOLDS_POSITION",
+    "HAS_SKILL", "REVIEWED_IN", "SET_GOAL",
+]
+MAX_PATHS = 300
+
+# Variable-length bounds can't be parameters in Cypher, so there is one query
+# text per hop depth (filtering a *1..2 pattern on length still expands every
+# 2-hop path). Each text is constant, so Neo4j caches one plan per depth.
+_EGO_QUERY_TEMPLATE = """
+    MATCH (center:Employee {employee_id: $eid})
+    CALL {
+        WITH center
+        MATCH path = (center)-[rels*1..%d]-(neighbor)
+        WHERE all(rel IN rels WHERE type(rel) IN $allowed_rels)
+        WITH path LIMIT $max_paths
+        UNWIND relationships(path) AS r
+        WITH DISTINCT r
+        RETURN startNode(r) AS src, endNode(r) AS tgt, r, type(r) AS rel_type
+    }
+    WITH center, collect({src: src, tgt: tgt, r: r, rel_type: rel_type}) AS edges
+    // Ship only the display properties, as [key, value] pairs so absent
+    // properties are dropped rather than sent back as nulls
+    RETURN [k IN $props WHERE center[k] IS NOT NULL | [k, center[k]]] AS center,
+           [e IN edges | {
+               src: [k IN $props WHERE e.src[k] IS NOT NULL | [k, e.src[k]]],
+               tgt: [k IN $props WHERE e.tgt[k] IS NOT NULL | [k, e.tgt[k]]],
+               r: properties(e.r),
+               rel_type: e.rel_type
+           }] AS edges
+"""
+_EGO_QUERIES = {hops: _EGO_QUERY_TEMPLATE % hops for hops in (1, 2)}
+
+# Tooltips are built in the browser the first time a node is hovered, from the
+# raw properties stored on the node, instead of shipping pre-rendered HTML for
+# every node. Produces the same "<b>key</b>: value<br>..." text as before.
+_LAZY_TOOLTIPS = """network.on("hoverNode", function (params) {
+                      var node = nodes.get(params.node);
+                      if (!node.title && node.props) {
+                          nodes.update({id: node.id, title: Object.keys(node.props).map(function (k) {
+                              return "<b>" + k + "</b>: " + node.props[k];
+                          }).join("<br>")});
+                      }
+                  });
+                  """
+
+# Injected before the template's `return network;`: freeze the layout once the
+# (hidden) stabilization pass finishes so the simulation doesn't keep running.
+_FREEZE_AFTER_STABILIZATION = """network.once("stabilizationIterationsDone", function () {
+                      network.setOptions({physics: false});
+                  });
+                  return network;"""
 
 
-def _get_conn() -> Neo4jConnection:
-    global _conn
-    if _conn is None:
-        _conn = Neo4jConnection()
-        _conn.verify()
-    return _conn
+# Distinguishing property key -> Neo4j label, in lookup priority order. The
+# keys double as the node ID keys.
+_KEY_TO_LABEL = {
+    "employee_id": "Employee",
+    "dept_id": "Department",
+    "division_id": "Division",
+    "location_id": "Location",
+    "position_id": "Position",
+    "family_id": "JobFamily",
+    "level_id": "JobLevel",
+    "skill_id": "Skill",
+    "req_id": "Requisition",
+    "application_id": "Application",
+    "interview_id": "Interview",
+    "offer_id": "Offer",
+    "channel_name": "SourceChannel",
+    "review_id": "PerformanceReview",
+    "goal_id": "Goal",
+    "cycle_id": "PerformanceCycle",
+    "band_id": "SalaryBand",
+    "salary_id": "BaseSalary",
+    "bonus_id": "Bonus",
+    "grant_id": "EquityGrant",
+    "event_id": "TemporalEvent",
+    "candidate_id": "Candidate",
+}
+_ID_KEYS_SET = frozenset(_KEY_TO_LABEL)
+_ID_RANK = {key: i for i, key in enumerate(_KEY_TO_LABEL)}
+
+# (color, size) per node label, resolved once instead of per node
+_STYLE = {label: (node_color(label), node_size(label)) for label in NODE_COLORS}
+_DEFAULT_STYLE = (node_color("Unknown"), node_size("Unknown"))
+
+# Internal keys that can appear in relationship dicts but aren't worth showing
+_EXCLUDED_REL_KEYS = frozenset({"_id", "_start", "_end"})
+
+_DISPLAY_KEYS = (
+    "name", "title", "channel_name", "description", "cycle_id",
+    "review_id", "goal_id", "salary_id", "bonus_id", "grant_id",
+    "event_id", "band_id", "skill_id",
+)
+_DISPLAY_KEYS_SET = frozenset(_DISPLAY_KEYS)
+_DISPLAY_RANK = {key: i for i, key in enumerate(_DISPLAY_KEYS)}
+
+# Node properties fetched for the graph: everything the id/label helpers look
+# at, plus a few fields worth showing in tooltips.
+_PROJECTED_PROPS = list(dict.fromkeys((
+    "first_name", "last_name", *_KEY_TO_LABEL, *_DISPLAY_KEYS,
+    "status", "job_level", "hire_date", "category", "rating",
+    "review_date", "amount", "effective_date", "event_type", "event_date",
+    "city", "state",
+)))
 
 
-def build_ego_graph(emp_id: str, hops: int = 1) -> str:
+def _node_label(node_dict: dict) -> str:
+    """Pick the best display label for a node."""
+    if "first_name" in node_dict and "last_name" in node_dict:
+        return f"{node_dict['first_name']} {node_dict['last_name']}"
+    # Intersect first so only keys actually present are ranked and checked
+    for key in sorted(_DISPLAY_KEYS_SET & node_dict.keys(), key=_DISPLAY_RANK.__getitem__):
+        if node_dict[key]:
+            return str(node_dict[key])
+    return str(node_dict.get("employee_id", ""))
+
+
+def _node_id(node_dict: dict) -> str:
+    """Get a unique ID for a node."""
+    for key in sorted(_ID_KEYS_SET & node_dict.keys(), key=_ID_RANK.__getitem__):
+        if node_dict[key]:
+            return str(node_dict[key])
+    return str(id(node_dict))
+
+
+def _node_label_type(node_dict: dict) -> str:
+    """Infer the Neo4j label from node properties."""
+    hit = _ID_KEYS_SET & node_dict.keys()
+    if hit:
+        return _KEY_TO_LABEL[min(hit, key=_ID_RANK.__getitem__)]
+    return "Unknown"
+
+
+def build_ego_graph(emp_id: str, hops: int = 1,
+                    allowed_rels: list[str] | None = None) -> str:
     """Build and save an interactive Pyvis ego-graph for an employee.
 
     Uses conn.run() directly (not query_graph) because we need native
-    dicts/lists for node properties rather than stringified values.
+    dicts/lists for node properties rather than stringified values. Only
+    the properties in _PROJECTED_PROPS are fetched for each node.
 
     Args:
         emp_id: Employee ID (e.g. "EMP-00001")
         hops: Number of hops from center (1 or 2)
+        allowed_rels: Relationship types to traverse (defaults to
+            DEFAULT_ALLOWED_RELS)
 
     Returns:
         Path to the saved HTML file.
     """
-    conn = _get_conn()
+    conn = get_conn()
     hops = max(1, min(hops, 2))
 
-    # Fetch all nodes and edges within N hops of the employee
-    data = conn.run("""
-        MATCH (center:Employee {employee_id: $eid})
-        CALL {
-            WITH center
-            MATCH path = (center)-[*1..%(hops)d]-(neighbor)
-            UNWIND relationships(path) AS r
-            WITH DISTINCT r,
-                 startNode(r) AS src,
-                 endNode(r) AS tgt
-            RETURN src, tgt, r, type(r) AS rel_type
-        }
-        WITH center, collect({src: src, tgt: tgt, r: r, rel_type: rel_type}) AS edges
-        RETURN center, edges
-    """ % {"hops": hops}, eid=emp_id)
+    # Fetch nodes and edges within N hops, capped at MAX_PATHS paths
+    data = conn.run(
+        _EGO_QUERIES[hops],
+        eid=emp_id,
+        allowed_rels=list(allowed_rels or DEFAULT_ALLOWED_RELS),
+        max_paths=MAX_PATHS,
+        props=_PROJECTED_PROPS,
+    )
 
     if not data:
         return ""
 
     row = data[0]
-    center = row["center"]
+    center = dict(row["center"])
     edges = row["edges"]
 
     net = Network(
@@ -70,74 +190,16 @@ def build_ego_graph(emp_id: str, hops: int = 1) -> str:
         font_color="white",
         directed=True,
     )
-    net.barnes_hut(gravity=-3000, central_gravity=0.3, spring_length=150)
+    # forceAtlas2Based settles faster than barnesHut; the capped stabilization
+    # runs before first paint and physics is switched off afterwards.
+    net.force_atlas_2based(gravity=-80, spring_length=150)
+    net.options.physics.stabilization.iterations = 200
+    # hoverNode events (used for the lazy tooltips) only fire with hover enabled
+    net.options.interaction.hover = True
 
     # Track added nodes to avoid duplicates
     added_nodes = set()
 
-    def _node_label(node_dict: dict) -> str:
-        """Pick the best display label for a node."""
-        if "first_name" in node_dict and "last_name" in node_dict:
-            return f"{node_dict['first_name']} {node_dict['last_name']}"
-        for key in ("name", "title", "channel_name", "description", "cycle_id",
-                     "review_id", "goal_id", "salary_id", "bonus_id", "grant_id",
-                     "event_id", "band_id", "skill_id"):
-            if key in node_dict and node_dict[key]:
-                return str(node_dict[key])
-        return str(node_dict.get("employee_id", ""))
-
-    def _node_id(node_dict: dict) -> str:
-        """Get a unique ID for a node."""
-        for key in ("employee_id", "dept_id", "division_id", "location_id",
-                     "position_id", "family_id", "level_id", "skill_id",
-                     "req_id", "application_id", "interview_id", "offer_id",
-                     "channel_name", "review_id", "goal_id", "cycle_id",
-                     "band_id", "salary_id", "bonus_id", "grant_id",
-                     "event_id", "candidate_id"):
-            if key in node_dict and node_dict[key]:
-                return str(node_dict[key])
-        return str(id(node_dict))
-
-    def _node_labels_from_dict(node_dict: dict) -> str:
-        """Infer the Neo4j label from node properties."""
-        # Map distinguishing property keys to labels
-        key_to_label = {
-            "employee_id": "Employee",
-            "dept_id": "Department",
-            "division_id": "Division",
-            "location_id": "Location",
-            "position_id": "Position",
-            "family_id": "JobFamily",
-            "level_id": "JobLevel",
-            "skill_id": "Skill",
-            "req_id": "Requisition",
-            "application_id": "Application",
-            "interview_id": "Interview",
-            "offer_id": "Offer",
-            "channel_name": "SourceChannel",
-            "review_id": "PerformanceReview",
-            "goal_id": "Goal",
-            "cycle_id": "PerformanceCycle",
-            "band_id": "SalaryBand",
-            "salary_id": "BaseSalary",
-            "bonus_id": "Bonus",
-            "grant_id": "EquityGrant",
-            "event_id": "TemporalEvent",
-            "candidate_id": "Candidate",
-        }
-        for key, label in key_to_label.items():
-            if key in node_dict:
-                return label
-        return "Unknown"
-
-    def _tooltip(node_dict: dict) -> str:
-        """Build HTML tooltip showing all properties."""
-        lines = []
-        for k, v in node_dict.items():
-            if v is not None:
-                lines.append(f"<b>{k}</b>: {v}")
-        return "<br>".join(lines)
-
     def _add_node(node_dict: dict, is_center: bool = False):
         """Add a node to the network if not already present."""
         nid = _node_id(node_dict)
@@ -145,9 +207,7 @@ def build_ego_graph(emp_id: str, hops: int = 1) -> str:
             return nid
         added_nodes.add(nid)
 
-        label_type = _node_labels_from_dict(node_dict)
-        color = node_color(label_type)
-        size = node_size(label_type)
+        color, size = _STYLE.get(_node_label_type(node_dict), _DEFAULT_STYLE)
 
         if is_center:
             size = size * 2
@@ -160,7 +220,7 @@ def build_ego_graph(emp_id: str, hops: int = 1) -> str:
         net.add_node(
             nid,
             label=_node_label(node_dict),
-            title=_tooltip(node_dict),
+            props={k: str(v) for k, v in node_dict.items() if v is not None},
             color={
                 "background": color,
                 "border": border_color,
@@ -176,8 +236,8 @@ def build_ego_graph(emp_id: str, hops: int = 1) -> str:
 
     # Add edges and neighbor nodes
     for edge_data in edges:
-        src_dict = edge_data["src"]
-        tgt_dict = edge_data["tgt"]
+        src_dict = dict(edge_data["src"])
+        tgt_dict = dict(edge_data["tgt"])
         rel_type = edge_data["rel_type"]
 
         src_id = _add_node(src_dict)
@@ -187,11 +247,11 @@ def build_ego_graph(emp_id: str, hops: int = 1) -> str:
         rel_props = edge_data.get("r", {})
         edge_title = rel_type
         if isinstance(rel_props, dict):
-            prop_lines = [f"<b>{rel_type}</b>"]
-            for k, v in rel_props.items():
-                if v is not None and k not in ("_id", "_start", "_end"):
-                    prop_lines.append(f"{k}: {v}")
-            edge_title = "<br>".join(prop_lines)
+            edge_title = "<br>".join([
+                f"<b>{rel_type}</b>",
+                *(f"{k}: {v}" for k, v in rel_props.items()
+                  if v is not None and k not in _EXCLUDED_REL_KEYS),
+            ])
 
         net.add_edge(
             src_id,
@@ -202,9 +262,14 @@ def build_ego_graph(emp_id: str, hops: int = 1) -> str:
             font={"size": 8, "color": "#999999"},
         )
 
+    # Large neighborhoods get a server-side layout instead of browser physics
+    apply_offline_layout(net)
+
     # Save
     EXPORTS_DIR.mkdir(parents=True, exist_ok=True)
     filename = f"ego_graph_{emp_id}.html"
     path = EXPORTS_DIR / filename
-    net.write_html(str(path))
+    write_html_chunked(net, path, replacements={
+        "return network;": _LAZY_TOOLTIPS + _FREEZE_AFTER_STABILIZATION,
+    })
     return str(path)
@@ -1,10 +1,5 @@
 """Describe the HR ontology schema: node types, relationship types, properties."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 import json
 from phase3_ontology.schema import ALL_NODE_SCHEMAS
 from phase3_ontology.relations import ALL_EDGE_SCHEMAS
@@ -13,6 +8,9 @@ from phase3_ontology.relations import ALL_EDGE_SCHEMAS
 def describe_ontology(entity_type: str = "all") -> str:
     """Describe the HR ontology schema.
 
+    The schemas are fixed at import time, so the JSON for every valid
+    entity_type is built once up front; unknown names get a fresh error.
+
     Args:
         entity_type: What to describe. Options:
             - "all": Full schema overview
@@ -24,6 +22,12 @@ def describe_ontology(entity_type: str = "all") -> str:
     Returns:
         JSON string with schema information.
     """
+    description = _DESCRIPTIONS.get(entity_type)
+    return description if description is not None else _describe(entity_type)
+
+
+def _describe(entity_type: str) -> str:
+    """Build the describe_ontology JSON for one entity_type."""
     if entity_type == "all":
         nodes = {}
         for name, schema in ALL_NODE_SCHEMAS.items():
@@ -90,3 +94,9 @@ def describe_ontology(entity_type: str = "all") -> str:
             "available_nodes": list(ALL_NODE_SCHEMAS.keys()),
             "available_edges": list(ALL_EDGE_SCHEMAS.keys()),
         })
+
+
+_DESCRIPTIONS = {
+    entity_type: _describe(entity_type)
+    for entity_type in ("all", "nodes", "edges", *ALL_NODE_SCHEMAS, *ALL_EDGE_SCHEMAS)
+}
@@ -1,30 +1,55 @@
 """Generate graph visualizations from Cypher queries."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
+import hashlib
 import json
+import shutil
 from pyvis.network import Network
 
-from config.settings import EXPORTS_DIR
-from phase4_graph.loader.neo4j_connection import Neo4jConnection
+from config.settings import EXPORTS_DIR, GRAPH_LOAD_STAMP
+from phase5_ai_interface.tools._cache import cached
+from phase5_ai_interface.tools._driver import get_conn
+from phase5_ai_interface.tools._html_export import write_html_chunked
+from phase5_ai_interface.tools._layout import apply_offline_layout
 from phase4_graph.visualization.style_config import node_color
 from phase4_graph.visualization.pyvis_renderer import (
     render_org_chart, render_department_network, render_compensation_map,
     render_recruiting_funnel, render_skills_network,
 )
 
-_conn = None
+
+class _FilenameCharTable(dict):
+    """str.translate table keeping alphanumerics, '-' and '_' and deleting the rest.
+
+    Decisions are cached per code point, so after the first few titles the
+    whole filter runs inside str.translate.
+    """
+
+    def __missing__(self, codepoint: int):
+        ch = chr(codepoint)
+        self[codepoint] = codepoint if ch.isalnum() or ch in "-_" else None
+        return self[codepoint]
 
 
-def _get_conn() -> Neo4jConnection:
-    global _conn
-    if _conn is None:
-        _conn = Neo4jConnection()
-        _conn.verify()
-    return _conn
+_FILENAME_CHARS = _FilenameCharTable()
+
+# Cap on nodes drawn by visualize_subgraph; more than this is unreadable anyway
+MAX_SUBGRAPH_NODES = 1000
+
+
+def _add_nodes_bulk(net: Network, batch: list[dict]) -> None:
+    """Append prebuilt node dicts to a Pyvis network in one pass.
+
+    Fills in the same defaults net.add_node() would and keeps node_ids/node_map
+    in sync, without the per-call bookkeeping. Assumes ids are already unique.
+    """
+    font = {"color": net.font_color}
+    for node in batch:
+        node.setdefault("color", "#97c2fc")
+        node.setdefault("shape", "dot")
+        node.setdefault("font", font)
+    net.nodes.extend(batch)
+    net.node_ids.extend(node["id"] for node in batch)
+    net.node_map.update((node["id"], node) for node in batch)
 
 
 def visualize_subgraph(cypher: str, title: str = "subgraph") -> str:
@@ -41,7 +66,7 @@ def visualize_subgraph(cypher: str, title: str = "subgraph") -> str:
         JSON with the file path to the generated HTML visualization.
     """
     try:
-        conn = _get_conn()
+        conn = get_conn()
         results = conn.run(cypher)
 
         if not results:
@@ -50,35 +75,89 @@ def visualize_subgraph(cypher: str, title: str = "subgraph") -> str:
         net = Network(height="600px", width="100%", bgcolor="#222222", font_color="white")
         net.barnes_hut(gravity=-3000)
 
-        nodes_added = set()
-        for row in results:
-            for key, val in row.items():
-                if isinstance(val, dict) and "id" in str(val):
-                    continue
-                if isinstance(val, str):
-                    node_id = val
-                    if node_id not in nodes_added:
-                        net.add_node(node_id, label=str(val)[:30], title=str(val))
-                        nodes_added.add(node_id)
+        # Every distinct string value becomes a node (dict.fromkeys dedupes
+        # while keeping first-seen order)
+        unique_strs = list(dict.fromkeys(
+            v for row in results for v in row.values() if isinstance(v, str)
+        ))
+        batch = [{"id": v, "label": v[:30], "title": v} for v in unique_strs[:MAX_SUBGRAPH_NODES]]
 
         # For simple tabular results, create a node-per-row visualization
-        if not nodes_added:
-            for i, row in enumerate(results[:100]):
-                label = " | ".join(str(v)[:20] for v in row.values() if v)
-                net.add_node(i, label=label[:40], title=json.dumps(row, default=str))
+        if not batch:
+            batch = [
+                {
+                    "id": i,
+                    "label": " | ".join(str(v)[:20] for v in row.values() if v)[:40],
+                    "title": json.dumps(row, default=str),
+                }
+                for i, row in enumerate(results[:100])
+            ]
+        _add_nodes_bulk(net, batch)
+        apply_offline_layout(net)
 
         EXPORTS_DIR.mkdir(parents=True, exist_ok=True)
-        safe_title = "".join(c for c in title if c.isalnum() or c in "-_").lower()
+        safe_title = title.translate(_FILENAME_CHARS).lower()
         filename = f"custom_{safe_title}.html"
         path = EXPORTS_DIR / filename
-        net.write_html(str(path))
+        write_html_chunked(net, path)
 
-        return json.dumps({"file": str(path), "node_count": len(nodes_added) or len(results)})
+        return json.dumps({"file": str(path), "node_count": len(batch)})
 
     except Exception as e:
         return json.dumps({"error": str(e)})
 
 
+_RENDER_FUNCS = {
+    "render_org_chart": render_org_chart,
+    "render_department_network": render_department_network,
+    "render_compensation_map": render_compensation_map,
+    "render_recruiting_funnel": render_recruiting_funnel,
+    "render_skills_network": render_skills_network,
+}
+
+
+RENDER_CACHE_DIR = EXPORTS_DIR / "render_cache"
+
+
+def _graph_fingerprint(conn) -> str:
+    """Short hash of the loader's load stamp and the graph's node and relationship counts.
+
+    The graph is only rewritten by the offline loader, which writes a new
+    stamp on every load (reloading the same data keeps the same counts), so
+    a new fingerprint means the renders need regenerating. The counts, read
+    from the count store, still catch loads made without the loader.
+    """
+    row = conn.run("""
+        CALL { MATCH (n) RETURN count(n) AS nodes }
+        CALL { MATCH ()-[r]->() RETURN count(r) AS rels }
+        RETURN nodes, rels
+    """)[0]
+    stamp = GRAPH_LOAD_STAMP.read_text() if GRAPH_LOAD_STAMP.exists() else ""
+    key = f"{stamp}:{row['nodes']}:{row['rels']}"
+    return hashlib.blake2b(key.encode(), digest_size=6).hexdigest()
+
+
+@cached(ttl_seconds=60)
+def _render(algorithm: str) -> str:
+    """Render a named visualization and return its file path.
+
+    Renders are kept on disk per graph fingerprint, so an unchanged graph
+    reuses the earlier HTML instead of rebuilding it with Pyvis.
+    """
+    conn = get_conn()
+    cache_path = RENDER_CACHE_DIR / f"{algorithm}_{_graph_fingerprint(conn)}.html"
+    if cache_path.exists():
+        return str(cache_path)
+
+    path = _RENDER_FUNCS[algorithm](conn)
+    RENDER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # Renders for older fingerprints can't be served again; don't let them pile up
+    for stale in RENDER_CACHE_DIR.glob(f"{algorithm}_*.html"):
+        stale.unlink(missing_ok=True)
+    shutil.copyfile(path, cache_path)
+    return str(cache_path)
+
+
 def run_graph_algorithm(algorithm: str, **kwargs) -> str:
     """Run a graph algorithm and return results.
 
@@ -99,21 +178,14 @@ def run_graph_algorithm(algorithm: str, **kwargs) -> str:
         JSON string with algorithm results.
     """
     try:
-        conn = _get_conn()
+        conn = get_conn()
 
         if algorithm == "centrality":
-            from phase4_graph.analytics.centrality import degree_centrality, span_of_control
+            from phase4_graph.analytics.centrality import degree_centrality, span_stats
             dc = degree_centrality(conn, "REPORTS_TO", kwargs.get("top_n", 15))
-            soc = span_of_control(conn)
-            spans = [r["direct_reports"] for r in soc] if soc else []
             return json.dumps({
                 "top_by_degree": dc,
-                "span_stats": {
-                    "avg": sum(spans) / len(spans) if spans else 0,
-                    "min": min(spans) if spans else 0,
-                    "max": max(spans) if spans else 0,
-                    "manager_count": len(spans),
-                }
+                "span_stats": span_stats(conn),
             }, indent=2, default=str)
 
         elif algorithm == "community":
@@ -147,16 +219,9 @@ def run_graph_algorithm(algorithm: str, **kwargs) -> str:
                             indent=2, default=str)
 
         elif algorithm.startswith("render_"):
-            render_funcs = {
-                "render_org_chart": render_org_chart,
-                "render_department_network": render_department_network,
-                "render_compensation_map": render_compensation_map,
-                "render_recruiting_funnel": render_recruiting_funnel,
-                "render_skills_network": render_skills_network,
-            }
-            func = render_funcs.get(algorithm)
-            if func:
-                path = func(conn)
+            if algorithm in _RENDER_FUNCS:
+                # Reuses the HTML on disk unless the graph has changed
+                path = _render(algorithm)
                 return json.dumps({"file": path, "algorithm": algorithm})
             return json.dumps({"error": f"Unknown render: {algorithm}"})
 
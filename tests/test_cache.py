@@ -0,0 +1,82 @@
+"""Tests for the in-process TTL cache used by the tool modules."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from phase5_ai_interface.tools import _cache
+from phase5_ai_interface.tools._cache import cached
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _counting(**cache_kwargs):
+    """A cached identity function plus the list of arguments it was really called with."""
+    calls = []
+
+    @cached(**cache_kwargs)
+    def func(value):
+        calls.append(value)
+        return value
+
+    return func, calls
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(_cache.time, "monotonic", clock)
+    func, calls = _counting(ttl_seconds=10)
+
+    func("a")
+    clock.now = 9.9
+    func("a")
+    assert calls == ["a"]
+
+    clock.now = 10.1
+    func("a")
+    assert calls == ["a", "a"]
+
+
+def test_least_recently_used_entry_is_evicted():
+    func, calls = _counting(maxsize=2)
+
+    func("a")
+    func("b")
+    func("a")  # "b" is now the least recently used
+    func("c")
+    func("a")
+    assert calls == ["a", "b", "c"]
+
+    func("b")
+    assert calls == ["a", "b", "c", "b"]
+
+
+def test_cache_if_skips_rejected_values():
+    func, calls = _counting(cache_if=lambda value: value != "skip")
+
+    func("keep")
+    func("keep")
+    func("skip")
+    func("skip")
+    assert calls == ["keep", "skip", "skip"]
+
+
+def test_unhashable_arguments_share_a_key():
+    func, calls = _counting()
+
+    func({"b": [1, {"c": 2}], "a": 1})
+    func({"a": 1, "b": [1, {"c": 2}]})
+    assert len(calls) == 1
+
+    func.cache_clear()
+    func({"a": 1, "b": [1, {"c": 2}]})
+    assert len(calls) == 2
@@ -0,0 +1,45 @@
+"""Tests for the DuckDB tool's Arrow column conversion."""
+
+import sys
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyarrow as pa
+
+from phase5_ai_interface.tools.duckdb_tools import _column_converter, _convert_columns
+
+
+def test_nan_becomes_null():
+    tbl = pa.table({"x": pa.array([1.5, float("nan"), None], pa.float64())})
+
+    assert _convert_columns(tbl).column("x").to_pylist() == [1.5, None, None]
+
+
+def test_timestamp_becomes_date_string():
+    tbl = pa.table({"hired": pa.array([datetime(2024, 3, 5, 14, 30), None], pa.timestamp("us"))})
+
+    assert _convert_columns(tbl).column("hired").to_pylist() == ["2024-03-05", None]
+
+
+def test_decimal_becomes_float():
+    tbl = pa.table({"amount": pa.array([Decimal("1234.50"), None], pa.decimal128(10, 2))})
+
+    column = _convert_columns(tbl).column("amount")
+    assert column.type == pa.float64()
+    assert column.to_pylist() == [1234.5, None]
+
+
+def test_interval_becomes_iso_duration():
+    tbl = pa.table({"gap": pa.array(
+        [pa.MonthDayNano([1, 2, 3_500_000_000]), None], pa.month_day_nano_interval(),
+    )})
+
+    assert _convert_columns(tbl).column("gap").to_pylist() == ["P1M2DT3.5S", None]
+
+
+def test_json_friendly_types_are_left_alone():
+    for typ in (pa.int64(), pa.string(), pa.bool_()):
+        assert _column_converter(typ) is None
@@ -0,0 +1,54 @@
+"""Tests for the chunked Pyvis HTML writer."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from pyvis.network import Network
+
+from phase5_ai_interface.tools._html_export import write_html_chunked
+
+
+def _network(n_nodes: int, title: str = "") -> Network:
+    net = Network(height="600px", width="100%", bgcolor="#222222", font_color="white")
+    for i in range(n_nodes):
+        net.add_node(i, label=f"node {i}", title=f"{title}{i} </script>")
+    for i in range(1, n_nodes):
+        net.add_edge(i - 1, i, title="next")
+    return net
+
+
+@pytest.mark.parametrize("n_nodes", [0, 5, 150])  # 150 crosses the >100-node loading bar
+@pytest.mark.parametrize("chunk_size", [1, 7, 500])
+def test_output_matches_write_html(tmp_path, monkeypatch, n_nodes, chunk_size):
+    # write_html copies pyvis's local JS assets into the working directory
+    monkeypatch.chdir(tmp_path)
+    net = _network(n_nodes)
+
+    net.write_html(str(tmp_path / "expected.html"))
+    write_html_chunked(net, tmp_path / "chunked.html", chunk_size=chunk_size)
+
+    assert (tmp_path / "chunked.html").read_bytes() == (tmp_path / "expected.html").read_bytes()
+
+
+def test_linked_tooltips_match_write_html(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    net = _network(5, title='<a href="https://example.com">link</a> ')
+
+    net.write_html(str(tmp_path / "expected.html"))
+    write_html_chunked(net, tmp_path / "chunked.html", chunk_size=2)
+
+    assert (tmp_path / "chunked.html").read_bytes() == (tmp_path / "expected.html").read_bytes()
+
+
+def test_replacements_apply_to_the_page_shell(tmp_path):
+    net = _network(3)
+
+    write_html_chunked(net, tmp_path / "out.html", replacements={
+        "return network;": "window.injected = true; return network;",
+    })
+
+    html = (tmp_path / "out.html").read_text(encoding="utf-8")
+    assert html.count("window.injected = true;") == 1
@@ -0,0 +1,47 @@
+"""Tests for the server-side Pyvis layout."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pyvis.network import Network
+
+from phase5_ai_interface.tools._layout import apply_offline_layout
+
+
+def _network(n_nodes: int, edges: bool = False) -> Network:
+    net = Network()
+    for i in range(n_nodes):
+        net.add_node(i)
+    if edges:
+        for i in range(1, n_nodes):
+            net.add_edge(i - 1, i)
+    return net
+
+
+def test_small_network_is_left_to_browser_physics():
+    net = _network(5, edges=True)
+
+    assert apply_offline_layout(net, threshold=5) is False
+    assert all("x" not in node for node in net.nodes)
+
+
+def test_large_network_is_pinned_and_physics_disabled():
+    net = _network(12, edges=True)
+
+    assert apply_offline_layout(net, threshold=5) is True
+    assert all(node["physics"] is False for node in net.nodes)
+    assert all(isinstance(node["x"], float) and isinstance(node["y"], float) for node in net.nodes)
+    assert net.options.physics.enabled is False
+
+
+def test_edgeless_network_is_placed_on_a_grid():
+    net = _network(10)
+
+    apply_offline_layout(net, threshold=5)
+
+    # 10 nodes -> 4 columns, 100px apart, filled row by row
+    positions = [(node["x"], node["y"]) for node in net.nodes]
+    assert positions[:5] == [(0.0, 0.0), (100.0, 0.0), (200.0, 0.0), (300.0, 0.0), (0.0, 100.0)]
+    assert len(set(positions)) == 10